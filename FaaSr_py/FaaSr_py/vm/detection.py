@@ -6,6 +6,8 @@ import logging
 
 logger = logging.getLogger("FaaSr_py.vm")
 
+REQUIRED_VM_FIELDS = ("Provider", "InstanceId", "Region", "AccessKey", "SecretKey")
+
 def workflow_needs_vm(faasr_payload):
     """
     Check if any function in the workflow requires VM resources.
@@ -16,13 +18,18 @@ def workflow_needs_vm(faasr_payload):
     Returns:
         bool: True if any function requires VM, False otherwise
     """
-    # First, verify this is GitHub Actions
+    # Without a VMConfig section there is nothing to orchestrate
+    if "VMConfig" not in faasr_payload:
+        return False
+    
+    # Verify this is GitHub Actions
     current_action = faasr_payload.get("FunctionInvoke", "")
     if not current_action:
         return False
     
+    action_list = faasr_payload.get("ActionList", {})
     try:
-        current_server = faasr_payload["ActionList"][current_action]["FaaSServer"]
+        current_server = action_list[current_action]["FaaSServer"]
         server_type = faasr_payload["ComputeServers"][current_server]["FaaSType"]
         
         if server_type != "GitHubActions":
@@ -32,16 +39,11 @@ def workflow_needs_vm(faasr_payload):
         logger.warning("Invalid payload structure - cannot determine FaaS type")
         return False
     
-    # Check if VMConfig section exists
-    if "VMConfig" not in faasr_payload:
-        return False
-    
-    # Check if any function requires VM
-    for action_name, action_config in faasr_payload.get("ActionList", {}).items():
-        if action_config.get("RequiresVM", False):
-            return True
-    
-    return False
+    # Check if any function requires VM, stopping at the first match
+    return any(
+        action_config.get("RequiresVM", False)
+        for action_config in action_list.values()
+    )
 
 def action_requires_vm(faasr_payload, action_name):
     """
@@ -69,10 +71,11 @@ def validate_vm_config(vm_config):
     Returns:
         bool: True if valid, raises ValueError if invalid
     """
-    required_fields = ["Provider", "InstanceId", "Region", "AccessKey", "SecretKey"]
-    for field in required_fields:
-        if field not in vm_config or not vm_config[field]:
-            raise ValueError(f"Missing required VM configuration field: {field}")
+    missing_field = next(
+        (field for field in REQUIRED_VM_FIELDS if not vm_config.get(field)), None
+    )
+    if missing_field is not None:
+        raise ValueError(f"Missing required VM configuration field: {missing_field}")
     
     if vm_config["Provider"] != "AWS":
         raise ValueError(f"Unsupported VM provider: {vm_config['Provider']}")
@@ -9,7 +9,24 @@ from FaaSr_py.client.py_client_stubs import (
     faasr_log,
     faasr_put_file,
 )
+from requests.adapters import HTTPAdapter
 from shapely.geometry import Point, Polygon
+from urllib3.util.retry import Retry
+
+# Reuse one pooled session so warm containers keep their connections alive
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
 
 
 def download_data(url: str, output_name: str) -> None:
@@ -21,7 +38,7 @@ def download_data(url: str, output_name: str) -> None:
         output_name: The name of the file to save the data to.
     """
     try:
-        response = requests.get(url, timeout=20)
+        response = _SESSION.get(url, timeout=(3.05, 20))
         response.raise_for_status()
 
         with open(output_name, "wb") as f:
@@ -10,7 +10,24 @@ from FaaSr_py.client.py_client_stubs import (
     faasr_put_file,
     faasr_rank,
 )
+from requests.adapters import HTTPAdapter
 from shapely.geometry import Point
+from urllib3.util.retry import Retry
+
+# Reuse one pooled session so the per-station downloads keep their connection alive
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
 
 
 def get_file(file_name: str, folder_name: str) -> None:
@@ -71,7 +88,7 @@ def download_station(url: str, output_name: str) -> int:
         The number of rows downloaded.
     """
     try:
-        response = requests.get(url, timeout=20)
+        response = _SESSION.get(url, timeout=(3.05, 20))
         response.raise_for_status()
 
         with open(output_name, "w") as f:
@@ -137,7 +154,11 @@ def get_temperature_data(
     )
 
     # Filter the data to the date range
-    df = df[(df["DATE"] >= start_date) & (df["DATE"] <= end_date)]
+    df["DATE"] = pd.to_datetime(df["DATE"], format="%Y-%m-%d", cache=True)
+    df = df[
+        (df["DATE"] >= pd.Timestamp(start_date))
+        & (df["DATE"] <= pd.Timestamp(end_date))
+    ]
 
     # Create a geometry column for the data
     geometry = df.apply(lambda row: Point(row["LONGITUDE"], row["LATITUDE"]), axis=1)
@@ -215,7 +215,10 @@ def plot_county_weekly_temperature(folder_name: str, county_name: str):
 
     # 2. Prepare the grid and points for heatmap interpolation
     X_grid, Y_grid = create_grid(outer_gdf)
-    points = np.column_stack([temp_gdf.geometry.x, temp_gdf.geometry.y])
+    # One (x, y) per station row so the points line up with the interpolated values
+    points = np.column_stack(
+        [temp_gdf.geometry.x.to_numpy(), temp_gdf.geometry.y.to_numpy()]
+    )
 
     # 3. Plot the heatmaps
     _, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
@@ -293,7 +296,10 @@ def plot_county_weekly_temperature_ranked(
 
     # 3. Prepare the grid and points for heatmap interpolation
     X_grid, Y_grid = create_grid(outer_gdf)
-    points = np.column_stack([temp_gdf.geometry.x, temp_gdf.geometry.y])
+    # One (x, y) per station row so the points line up with the interpolated values
+    points = np.column_stack(
+        [temp_gdf.geometry.x.to_numpy(), temp_gdf.geometry.y.to_numpy()]
+    )
 
     # 4. Plot the heatmaps
     _, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
@@ -6,6 +6,23 @@ from FaaSr_py.client.py_client_stubs import (
     faasr_put_file,
     faasr_return,
 )
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Reuse one pooled session so warm containers keep their connections alive
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
 
 
 def file_exists() -> bool:
@@ -47,13 +64,17 @@ def download_data(url: str, output_name: str) -> int:
         The number of rows downloaded.
     """
     try:
-        response = requests.get(url, timeout=20)
+        response = _SESSION.get(url, timeout=(3.05, 20), stream=True)
         response.raise_for_status()
 
-        with open(output_name, "w") as f:
-            f.write(response.text)
+        # Stream the response to disk in 64 KB chunks, counting newlines as we go
+        num_newlines = 0
+        with open(output_name, "wb") as f:
+            for chunk in response.iter_content(chunk_size=1 << 16):
+                f.write(chunk)
+                num_newlines += chunk.count(b"\n")
 
-        return len(response.text.split("\n")) - 1  # Subtract 1 for the header row
+        return num_newlines  # Each data row is preceded by one newline
 
     except Exception as e:
         faasr_log(f"Error downloading data from {url}: {e}")
@@ -77,6 +98,7 @@ def get_ghcnd_data(folder_name: str, output_name: str, station_id: str):
 
     # 2. Download the file to a local file
     num_rows = download_data(url, output_name)
+
     faasr_log(f"Downloaded {num_rows} rows from {url}")
 
     # 3. Upload the file to the S3 bucket
@@ -1,16 +1,45 @@
-from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from importlib.util import find_spec
 
+import numpy as np
 import pandas as pd
 from FaaSr_py.client.py_client_stubs import faasr_get_file, faasr_log, faasr_put_file
 
+# Use pyarrow's multi-threaded CSV parser when it is installed
+CSV_ENGINE = "pyarrow" if find_spec("pyarrow") is not None else "c"
 
-def get_input_data(folder_name: str, input_name: str) -> pd.DataFrame:
+# Explicit dtypes for the GHCND columns processed by this module
+GHCND_DTYPES = {
+    "DATE": "string",
+    "PRCP": "float32",
+    "TMIN": "float32",
+    "TMAX": "float32",
+}
+
+# Fixed MM-DD categories so grouping by day hashes integer codes instead of strings
+DAY_DTYPE = pd.CategoricalDtype(
+    categories=[
+        f"{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 32)
+    ],
+    ordered=True,
+)
+
+
+def get_input_data(
+    folder_name: str,
+    input_name: str,
+    column_name: str,
+) -> pd.DataFrame:
     """
-    Get the input data from the FaaSr bucket and return it as a pandas DataFrame.
+    Get the input data from the FaaSr bucket and return it as a pandas DataFrame
+    indexed by a sorted DATE column, with a DAY column holding the day of the year in
+    MM-DD format. Only the DATE column and the column to process are parsed.
 
     Args:
         folder_name: The name of the folder to get the input data from.
         input_name: The name of the input file to get the data from.
+        column_name: The name of the column to process.
 
     Returns:
         A pandas DataFrame containing the input data.
@@ -20,22 +49,35 @@ def get_input_data(folder_name: str, input_name: str) -> pd.DataFrame:
         remote_folder=folder_name,
         remote_file=input_name,
     )
-    return pd.read_csv(input_name)
+    usecols = ["DATE", column_name]
+    df = pd.read_csv(
+        input_name,
+        engine=CSV_ENGINE,
+        usecols=usecols,
+        dtype={col: GHCND_DTYPES[col] for col in usecols if col in GHCND_DTYPES},
+    )
+
+    # Derive the day of the year once for both the current and previous years
+    df["DAY"] = df["DATE"].str.slice(5).astype(DAY_DTYPE)
+
+    # Parse dates once so slicing can use the sorted index
+    df["DATE"] = pd.to_datetime(df["DATE"], format="%Y-%m-%d", cache=True)
+    return df.set_index("DATE").sort_index()
 
 
 def slice_data_by_date(df: pd.DataFrame, start: str, end: str) -> pd.DataFrame:
     """
-    Slice the data by date and return a new DataFrame.
+    Slice the data by date. The returned DataFrame is a view and must not be mutated.
 
     Args:
-        df: A pandas DataFrame containing the data to slice.
+        df: A pandas DataFrame indexed by a sorted DATE column.
         start: The start date to slice the data from.
         end: The end date to slice the data to.
 
     Returns:
         A pandas DataFrame containing the sliced data.
     """
-    return df[(df["DATE"] >= start) & (df["DATE"] <= end)].copy()
+    return df.loc[pd.Timestamp(start) : pd.Timestamp(end)]
 
 
 def process_current_year(
@@ -60,8 +102,7 @@ def process_current_year(
     current_year = slice_data_by_date(df, start, end)
 
     # Get only the day of the year and the column value
-    current_year["DAY"] = current_year["DATE"].apply(lambda x: x[5:])
-    return current_year[["DAY", column_name]]
+    return current_year[["DAY", column_name]].reset_index(drop=True)
 
 
 def process_previous_years(
@@ -84,40 +125,62 @@ def process_previous_years(
         A pandas DataFrame containing the processed data.
     """
 
-    # Get data for the same period + 30 days from the previous 10 years
-    previous_years_data = []
-
-    start_date = datetime.strptime(start, "%Y-%m-%d")
-    end_date = datetime.strptime(end, "%Y-%m-%d")
+    # Get the windows for the same period + 30 days from the previous 10 years
+    start_date = date.fromisoformat(start)
+    end_date = date.fromisoformat(end)
+
+    window_starts = [
+        start_date.replace(year=start_date.year - year_offset)
+        for year_offset in range(1, 11)
+    ]
+
+    # Add 30 days to the end date
+    window_ends = [
+        end_date.replace(year=end_date.year - year_offset) + timedelta(days=30)
+        for year_offset in range(1, 11)
+    ]
+
+    # Count how many windows each row falls in. Windows overlap when the period spans
+    # most of a year, and a row in several windows counts once per window.
+    window_counts = np.zeros(len(df), dtype=np.intp)
+    for window_start, window_end in zip(window_starts, window_ends):
+        lower = df.index.searchsorted(pd.Timestamp(window_start), side="left")
+        upper = df.index.searchsorted(pd.Timestamp(window_end), side="right")
+        window_counts[lower:upper] += 1
 
-    for year_offset in range(1, 11):
-        # Get data for this year
-        prev_start_date = date(
-            year=start_date.year - year_offset,
-            month=start_date.month,
-            day=start_date.day,
-        )
-
-        prev_end_date = date(
-            year=end_date.year - year_offset,
-            month=end_date.month,
-            day=end_date.day,
-        ) + timedelta(days=30)  # Add 30 days to the end date
+    # Calculate the mean value for each day across previous years
+    rows = np.repeat(np.arange(len(df)), window_counts)
+    previous_years = df.iloc[rows][["DAY", column_name]]
+    return (
+        previous_years.groupby("DAY", observed=True)[column_name].mean().reset_index()
+    )
 
-        year_data = slice_data_by_date(
-            df,
-            prev_start_date.strftime("%Y-%m-%d"),
-            prev_end_date.strftime("%Y-%m-%d"),
-        )
 
-        # Convert date to MM-DD format for comparison
-        year_data["DAY"] = year_data["DATE"].apply(lambda x: x[5:])
-        previous_years_data.append(year_data[["DAY", column_name]])
+def write_csv(df: pd.DataFrame, file_name: str) -> None:
+    """
+    Write a DataFrame to a local CSV file without its index. pyarrow's columnar writer
+    is used when it is installed.
 
-    # Calculate the mean value for each day across previous years
-    previous_years = pd.concat(previous_years_data, ignore_index=True)
-    df = previous_years.groupby("DAY")[column_name].mean().reset_index()
-    return df
+    Args:
+        df: A pandas DataFrame containing the data to write.
+        file_name: The name of the file to write the data to.
+    """
+    if CSV_ENGINE == "pyarrow":
+        from pyarrow import Table, csv
+
+        # pyarrow quotes header names regardless of the quoting style, so the header
+        # is written unquoted here to match to_csv
+        with open(file_name, "wb") as f:
+            f.write(f"{','.join(df.columns)}\n".encode())
+            csv.write_csv(
+                Table.from_pandas(df, preserve_index=False),
+                f,
+                write_options=csv.WriteOptions(
+                    include_header=False, quoting_style="none"
+                ),
+            )
+    else:
+        df.to_csv(file_name, index=False, float_format="%.6g", lineterminator="\n")
 
 
 def upload_current_year_data(
@@ -133,7 +196,7 @@ def upload_current_year_data(
         output_name: The name of the output file to save the data to.
         current_year: A pandas DataFrame containing the current year data.
     """
-    current_year.to_csv(f"current_year_{output_name}", index=False)
+    write_csv(current_year, f"current_year_{output_name}")
 
     faasr_put_file(
         local_file=f"current_year_{output_name}",
@@ -155,7 +218,7 @@ def upload_previous_years_data(
         output_name: The name of the output file to save the data to.
         previous_years: A pandas DataFrame containing the previous years data.
     """
-    previous_years.to_csv(f"previous_years_{output_name}", index=False)
+    write_csv(previous_years, f"previous_years_{output_name}")
 
     faasr_put_file(
         local_file=f"previous_years_{output_name}",
@@ -185,18 +248,27 @@ def compare_to_yearly_average(
         end: The end date to process the data to.
     """
     # 1. Get the input data
-    df = get_input_data(folder_name, input_name)
+    df = get_input_data(folder_name, input_name, column_name)
     faasr_log(f"Loaded input data from {folder_name}/{input_name} with {len(df)} rows")
 
-    # 2. Process the current year data
-    current_year = process_current_year(df, column_name, start, end)
-    faasr_log("Processed current year data")
+    # 2. Process the current and previous years data. Both only read from df, so they
+    # are run concurrently.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        current_year_future = executor.submit(
+            process_current_year, df, column_name, start, end
+        )
+        previous_years_future = executor.submit(
+            process_previous_years, df, column_name, start, end
+        )
+
+        current_year = current_year_future.result()
+        faasr_log("Processed current year data")
 
-    # 3. Process the previous years data
-    previous_years = process_previous_years(df, column_name, start, end)
-    faasr_log("Processed previous years data")
+        previous_years = previous_years_future.result()
+        faasr_log("Processed previous years data")
 
-    # 4. Upload the output data
+    # 3. Upload the output data. FaaSr RPCs each flush the shared function log, so the
+    # uploads are made one at a time.
     upload_current_year_data(folder_name, output_name, current_year)
     faasr_log(f"Uploaded data to {folder_name}/current_year_{output_name}")
 
@@ -1,37 +1,44 @@
-import matplotlib.pyplot as plt
+from functools import cache
+
+import numpy as np
 import pandas as pd
 from FaaSr_py.client.py_client_stubs import faasr_get_file, faasr_log, faasr_put_file
 from matplotlib.axes import Axes
+from matplotlib.figure import Figure
 
 
-def get_input_data(
-    folder_name: str,
-    input_name: str,
-) -> tuple[pd.DataFrame, pd.DataFrame]:
+def download_input_data(folder_name: str, input_names: list[str]) -> None:
     """
-    Get the input data from the FaaSr bucket and return it as a pandas DataFrame.
+    Download the current year and previous years files for each input from the FaaSr
+    bucket.
 
     Args:
         folder_name: The name of the folder to get the input data from.
+        input_names: The names of the input files to get the data from.
+    """
+    # Downloads run one at a time: each FaaSr RPC flushes the function's shared S3
+    # log, which is not safe to do from concurrent requests
+    for input_name in input_names:
+        for prefix in ("current_year", "previous_years"):
+            faasr_get_file(
+                local_file=f"{prefix}_{input_name}",
+                remote_folder=folder_name,
+                remote_file=f"{prefix}_{input_name}",
+            )
+
+
+def get_input_data(input_name: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Load the downloaded input data and return it as pandas DataFrames indexed by DAY.
+
+    Args:
         input_name: The name of the input file to get the data from.
 
     Returns:
         A tuple containing the current year data and the previous years data.
     """
-    faasr_get_file(
-        local_file=f"current_year_{input_name}",
-        remote_folder=folder_name,
-        remote_file=f"current_year_{input_name}",
-    )
-
-    faasr_get_file(
-        local_file=f"previous_years_{input_name}",
-        remote_folder=folder_name,
-        remote_file=f"previous_years_{input_name}",
-    )
-
-    current_year_data = pd.read_csv(f"current_year_{input_name}")
-    previous_years_data = pd.read_csv(f"previous_years_{input_name}")
+    current_year_data = pd.read_csv(f"current_year_{input_name}", index_col="DAY")
+    previous_years_data = pd.read_csv(f"previous_years_{input_name}", index_col="DAY")
 
     return current_year_data, previous_years_data
 
@@ -59,17 +66,27 @@ def prepare_data(
         A tuple containing the current year data and the previous years data.
     """
 
-    # Merge the dataframes on the DAY column
-    current_year = current_year_precip.merge(current_year_min_temp, on="DAY")
-    current_year = current_year.merge(current_year_max_temp, on="DAY")
-    prev_years = prev_years_precip.merge(prev_years_min_temp, on="DAY")
-    prev_years = prev_years.merge(prev_years_max_temp, on="DAY")
+    # Align the dataframes on their DAY index
+    current_year = pd.concat(
+        [current_year_precip, current_year_min_temp, current_year_max_temp],
+        axis=1,
+        join="inner",
+    ).reset_index()
+
+    prev_years = pd.concat(
+        [prev_years_precip, prev_years_min_temp, prev_years_max_temp],
+        axis=1,
+        join="inner",
+    ).reset_index()
+
+    # Downcast to float32, which is plenty of precision for plotting
+    dtypes = {"PRCP": np.float32, "TMAX": np.float32, "TMIN": np.float32}
+    current_year = current_year.astype(dtypes)
+    prev_years = prev_years.astype(dtypes)
 
     # Convert temperature from tenths of degrees Celsius to degrees Celsius
-    current_year["TMAX"] = current_year["TMAX"] / 10
-    current_year["TMIN"] = current_year["TMIN"] / 10
-    prev_years["TMAX"] = prev_years["TMAX"] / 10
-    prev_years["TMIN"] = prev_years["TMIN"] / 10
+    current_year[["TMAX", "TMIN"]] *= np.float32(0.1)
+    prev_years[["TMAX", "TMIN"]] *= np.float32(0.1)
 
     # Drop leap days
     current_year = current_year[current_year["DAY"] != "02-29"]
@@ -78,12 +95,41 @@ def prepare_data(
     return current_year, prev_years
 
 
+@cache
+def create_figure() -> tuple[Figure, tuple[Axes, Axes, Axes]]:
+    """
+    Create the figure with 3 subplots. The figure is created once per container and
+    reused by later invocations. It is built without pyplot, so no interactive backend
+    is negotiated and the figure is rendered with Agg when saved.
+
+    Returns:
+        A tuple containing the figure and its three axes.
+    """
+    fig = Figure(figsize=(12, 10))
+    ax1, ax2, ax3 = fig.subplots(3, 1)
+    return fig, (ax1, ax2, ax3)
+
+
+def get_figure() -> tuple[Figure, tuple[Axes, Axes, Axes]]:
+    """
+    Get the shared figure with its axes cleared for a new plot.
+
+    Returns:
+        A tuple containing the figure and its three axes.
+    """
+    fig, axes = create_figure()
+    for ax in axes:
+        ax.cla()
+
+    return fig, axes
+
+
 def plot_subplot(
     ax: Axes,
-    x_data: pd.Series,
-    y_data: pd.Series,
-    prev_years_x_data: pd.Series,
-    prev_years_y_data: pd.Series,
+    x_data: np.ndarray,
+    y_data: np.ndarray,
+    prev_years_x_data: np.ndarray,
+    prev_years_y_data: np.ndarray,
     title: str,
     ylabel: str,
 ) -> None:
@@ -152,26 +198,20 @@ def plot_weather_comparison(
     """
 
     # 1. Get the input data
-    current_year_precip, prev_years_precip = get_input_data(
+    download_input_data(
         folder_name,
-        input_precip_name,
+        [input_precip_name, input_min_temp_name, input_max_temp_name],
     )
 
+    current_year_precip, prev_years_precip = get_input_data(input_precip_name)
     faasr_log(f"Loaded precipitation data from {folder_name}/{input_precip_name}")
 
-    current_year_min_temp, prev_years_min_temp = get_input_data(
-        folder_name,
-        input_min_temp_name,
-    )
-
+    current_year_min_temp, prev_years_min_temp = get_input_data(input_min_temp_name)
     faasr_log(
         f"Loaded minimum temperature data from {folder_name}/{input_min_temp_name}"
     )
 
-    current_year_max_temp, prev_years_max_temp = get_input_data(
-        folder_name,
-        input_max_temp_name,
-    )
+    current_year_max_temp, prev_years_max_temp = get_input_data(input_max_temp_name)
 
     faasr_log(
         f"Loaded maximum temperature data from {folder_name}/{input_max_temp_name}"
@@ -190,16 +230,16 @@ def plot_weather_comparison(
     faasr_log("Prepared data for plotting")
 
     # 3. Create the figure with 3 subplots
-    _, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 10))
-    plt.suptitle(f"Current Year Weather Data with 10 Year Average for {location}")
+    fig, (ax1, ax2, ax3) = get_figure()
+    fig.suptitle(f"Current Year Weather Data with 10 Year Average for {location}")
 
     # Precipitation subplot
     plot_subplot(
         ax=ax1,
-        x_data=current_year["DAY"],
-        y_data=current_year["PRCP"],
-        prev_years_x_data=prev_years["DAY"],
-        prev_years_y_data=prev_years["PRCP"],
+        x_data=current_year["DAY"].to_numpy(),
+        y_data=current_year["PRCP"].to_numpy(),
+        prev_years_x_data=prev_years["DAY"].to_numpy(),
+        prev_years_y_data=prev_years["PRCP"].to_numpy(),
         title="Precipitation",
         ylabel="Precipitation (mm)",
     )
@@ -209,10 +249,10 @@ def plot_weather_comparison(
     # Maximum temperature subplot
     plot_subplot(
         ax=ax2,
-        x_data=current_year["DAY"],
-        y_data=current_year["TMAX"],
-        prev_years_x_data=prev_years["DAY"],
-        prev_years_y_data=prev_years["TMAX"],
+        x_data=current_year["DAY"].to_numpy(),
+        y_data=current_year["TMAX"].to_numpy(),
+        prev_years_x_data=prev_years["DAY"].to_numpy(),
+        prev_years_y_data=prev_years["TMAX"].to_numpy(),
         title="Maximum Temperature",
         ylabel="Temperature (°C)",
     )
@@ -222,10 +262,10 @@ def plot_weather_comparison(
     # Minimum temperature subplot
     plot_subplot(
         ax=ax3,
-        x_data=current_year["DAY"],
-        y_data=current_year["TMIN"],
-        prev_years_x_data=prev_years["DAY"],
-        prev_years_y_data=prev_years["TMIN"],
+        x_data=current_year["DAY"].to_numpy(),
+        y_data=current_year["TMIN"].to_numpy(),
+        prev_years_x_data=prev_years["DAY"].to_numpy(),
+        prev_years_y_data=prev_years["TMIN"].to_numpy(),
         title="Minimum Temperature",
         ylabel="Temperature (°C)",
     )
@@ -233,9 +273,8 @@ def plot_weather_comparison(
     faasr_log("Plotted minimum temperature subplot")
 
     # 4. Save the plot to a file and upload it to the S3 bucket
-    plt.tight_layout()
-    plt.savefig(output_name)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(output_name)
 
     faasr_put_file(
         local_file=output_name,
@@ -267,26 +306,20 @@ def plot_weather_comparison_data_stores(
     """
 
     # 1. Get the input data
-    current_year_precip, prev_years_precip = get_input_data(
+    download_input_data(
         folder_name,
-        input_precip_name,
+        [input_precip_name, input_min_temp_name, input_max_temp_name],
     )
 
+    current_year_precip, prev_years_precip = get_input_data(input_precip_name)
     faasr_log(f"Loaded precipitation data from {folder_name}/{input_precip_name}")
 
-    current_year_min_temp, prev_years_min_temp = get_input_data(
-        folder_name,
-        input_min_temp_name,
-    )
-
+    current_year_min_temp, prev_years_min_temp = get_input_data(input_min_temp_name)
     faasr_log(
         f"Loaded minimum temperature data from {folder_name}/{input_min_temp_name}"
     )
 
-    current_year_max_temp, prev_years_max_temp = get_input_data(
-        folder_name,
-        input_max_temp_name,
-    )
+    current_year_max_temp, prev_years_max_temp = get_input_data(input_max_temp_name)
 
     faasr_log(
         f"Loaded maximum temperature data from {folder_name}/{input_max_temp_name}"
@@ -305,16 +338,16 @@ def plot_weather_comparison_data_stores(
     faasr_log("Prepared data for plotting")
 
     # 3. Create the figure with 3 subplots
-    _, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 10))
-    plt.suptitle(f"Current Year Weather Data with 10 Year Average for {location}")
+    fig, (ax1, ax2, ax3) = get_figure()
+    fig.suptitle(f"Current Year Weather Data with 10 Year Average for {location}")
 
     # Precipitation subplot
     plot_subplot(
         ax=ax1,
-        x_data=current_year["DAY"],
-        y_data=current_year["PRCP"],
-        prev_years_x_data=prev_years["DAY"],
-        prev_years_y_data=prev_years["PRCP"],
+        x_data=current_year["DAY"].to_numpy(),
+        y_data=current_year["PRCP"].to_numpy(),
+        prev_years_x_data=prev_years["DAY"].to_numpy(),
+        prev_years_y_data=prev_years["PRCP"].to_numpy(),
         title="Precipitation",
         ylabel="Precipitation (mm)",
     )
@@ -324,10 +357,10 @@ def plot_weather_comparison_data_stores(
     # Maximum temperature subplot
     plot_subplot(
         ax=ax2,
-        x_data=current_year["DAY"],
-        y_data=current_year["TMAX"],
-        prev_years_x_data=prev_years["DAY"],
-        prev_years_y_data=prev_years["TMAX"],
+        x_data=current_year["DAY"].to_numpy(),
+        y_data=current_year["TMAX"].to_numpy(),
+        prev_years_x_data=prev_years["DAY"].to_numpy(),
+        prev_years_y_data=prev_years["TMAX"].to_numpy(),
         title="Maximum Temperature",
         ylabel="Temperature (°C)",
     )
@@ -337,10 +370,10 @@ def plot_weather_comparison_data_stores(
     # Minimum temperature subplot
     plot_subplot(
         ax=ax3,
-        x_data=current_year["DAY"],
-        y_data=current_year["TMIN"],
-        prev_years_x_data=prev_years["DAY"],
-        prev_years_y_data=prev_years["TMIN"],
+        x_data=current_year["DAY"].to_numpy(),
+        y_data=current_year["TMIN"].to_numpy(),
+        prev_years_x_data=prev_years["DAY"].to_numpy(),
+        prev_years_y_data=prev_years["TMIN"].to_numpy(),
         title="Minimum Temperature",
         ylabel="Temperature (°C)",
     )
@@ -348,9 +381,8 @@ def plot_weather_comparison_data_stores(
     faasr_log("Plotted minimum temperature subplot")
 
     # 4. Save the plot to a file and upload it to the S3 bucket
-    plt.tight_layout()
-    plt.savefig(output_name)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(output_name)
 
     faasr_put_file(
         local_file=output_name,
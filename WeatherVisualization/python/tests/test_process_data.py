@@ -0,0 +1,103 @@
+import importlib.util
+import sys
+import types
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+MODULE_PATH = Path(__file__).parents[1] / "02_process_data.py"
+
+
+@pytest.fixture(scope="module")
+def process_data():
+    # The FaaSr runtime provides these functions; they are unused by the tests
+    stubs = types.ModuleType("FaaSr_py.client.py_client_stubs")
+    stubs.faasr_get_file = stubs.faasr_log = stubs.faasr_put_file = None
+    modules = {
+        "FaaSr_py": types.ModuleType("FaaSr_py"),
+        "FaaSr_py.client": types.ModuleType("FaaSr_py.client"),
+        "FaaSr_py.client.py_client_stubs": stubs,
+    }
+    saved = {name: sys.modules.get(name) for name in modules}
+    sys.modules.update(modules)
+    try:
+        spec = importlib.util.spec_from_file_location("process_data", MODULE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        for name, original in saved.items():
+            if original is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = original
+
+
+@pytest.fixture(scope="module")
+def weather_data(process_data):
+    dates = pd.date_range("2010-01-01", "2024-12-31", freq="D")
+    df = pd.DataFrame(
+        {
+            "DATE": dates,
+            "DAY": dates.strftime("%m-%d").astype(process_data.DAY_DTYPE),
+            "TMAX": np.arange(len(dates), dtype="float32"),
+        }
+    )
+    return df.set_index("DATE")
+
+
+def previous_years_per_window(df, column_name, start, end):
+    """Average each day across the per-year windows sliced one at a time."""
+    start_date = date.fromisoformat(start)
+    end_date = date.fromisoformat(end)
+
+    windows = []
+    for year_offset in range(1, 11):
+        window_start = start_date.replace(year=start_date.year - year_offset)
+        window_end = end_date.replace(year=end_date.year - year_offset)
+        window_end += timedelta(days=30)
+        window = df.loc[pd.Timestamp(window_start) : pd.Timestamp(window_end)]
+        windows.append(window[["DAY", column_name]])
+
+    previous_years = pd.concat(windows, ignore_index=True)
+    return (
+        previous_years.groupby("DAY", observed=True)[column_name].mean().reset_index()
+    )
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        ("2024-06-01", "2024-06-30"),
+        ("2024-01-01", "2024-12-31"),
+        ("2023-11-15", "2024-02-15"),
+        ("2023-07-01", "2024-06-30"),
+    ],
+)
+def test_process_previous_years(process_data, weather_data, start, end):
+    result = process_data.process_previous_years(weather_data, "TMAX", start, end)
+    expected = previous_years_per_window(weather_data, "TMAX", start, end)
+
+    assert not result.empty
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("csv_engine", ["pyarrow", "c"])
+def test_write_csv_header(process_data, monkeypatch, tmp_path, csv_engine):
+    if csv_engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(process_data, "CSV_ENGINE", csv_engine)
+
+    df = pd.DataFrame(
+        {
+            "DAY": pd.Categorical(["01-01", "01-02"]),
+            "TMAX": np.array([1.5, 2.25], dtype="float32"),
+        }
+    )
+    file_name = tmp_path / "output.csv"
+    process_data.write_csv(df, file_name)
+
+    assert file_name.read_text().splitlines() == ["DAY,TMAX", "01-01,1.5", "01-02,2.25"]
@@ -1,5 +1,6 @@
 import re
 import threading
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from scripts.faasr_function_logger import FaaSrFunctionLogger, LogEvent
@@ -44,6 +45,7 @@ class FaaSrFunction:
         self.s3_client = s3_client
         self.stream_logs = stream_logs
         self.interval_seconds = interval_seconds
+        self._workflow_prefix = f"{workflow_name}-"
 
         # Initialize function logger
         self._logger = FaaSrFunctionLogger(
@@ -59,6 +61,10 @@ class FaaSrFunction:
         self._status = FunctionStatus.PENDING
         self._invocations: set[str] | None = None
 
+        # Failure scan state
+        self._failed = False
+        self._failure_scan_index = 0
+
         # Thread safety
         self._lock = threading.Lock()
 
@@ -77,7 +83,7 @@ class FaaSrFunction:
         with self._lock:
             return self._status
 
-    @property
+    @cached_property
     def done_key(self) -> str:
         """
         Get the complete `.done` file S3 key.
@@ -146,11 +152,27 @@ class FaaSrFunction:
         if self._check_for_failure():
             self.set_status(FunctionStatus.FAILED)
             self._logger.stop()
-        # Check for completion
+        # Check for completion. The function writes its last lines before the `.done`
+        # file, so the status is only set once the logger has drained and the final
+        # lines have been scanned on LOG_COMPLETE.
         elif self._check_for_completion():
-            self.set_status(FunctionStatus.COMPLETED)
             self._logger.stop()
 
+    def check_status(self) -> FunctionStatus:
+        """
+        Check a running function for failure or completion.
+
+        Logs stop updating once the function writes its last line, which can be before
+        the key listing shows the `.done` file, so the workflow calls this each tick. A
+        listed `.done` file stops the logger, and the function is reported as completed
+        once its remaining logs have been fetched and scanned for errors.
+
+        Returns:
+            FunctionStatus: The function status after the check.
+        """
+        self._handle_log_updated()
+        return self.status
+
     def _handle_log_complete(self) -> None:
         """Handle when logs are complete."""
         # Extract invocations from logs
@@ -158,26 +180,44 @@ class FaaSrFunction:
         # Final status check
         if self._check_for_failure():
             self.set_status(FunctionStatus.FAILED)
-        elif self._check_for_completion():
+        elif self._check_for_completion(confirm=True):
             self.set_status(FunctionStatus.COMPLETED)
 
     def _check_for_failure(self) -> bool:
         """
-        Check if the logs contain an error-level log.
+        Check if the logs contain an error-level log (thread-safe).
+
+        Only logs fetched since the last check are scanned, and a detected failure
+        is remembered. A substring check skips the regex for lines without `[ERROR]`.
 
         Returns:
             bool: True if the logs contain an error-level log, False otherwise.
         """
-        return self.failed_regex.search(self._logger.logs_content) is not None
-
-    def _check_for_completion(self) -> bool:
+        with self._lock:
+            if not self._failed:
+                new_logs = self._logger.logs_since(self._failure_scan_index)
+                self._failure_scan_index += len(new_logs)
+                self._failed = any(
+                    "[ERROR]" in log and self.failed_regex.search(log)
+                    for log in new_logs
+                )
+            return self._failed
+
+    def _check_for_completion(self, confirm: bool = False) -> bool:
         """
-        Check if the function has completed by looking for the .done file.
+        Check if the function has completed by looking for the .done file in the
+        workflow's key listing.
+
+        Args:
+            confirm: Whether to fall back to a HeadObject when the `.done` file is not
+                listed, in case it was written after the last listing.
 
         Returns:
             bool: True if the function has completed, False otherwise.
         """
-        return self.s3_client.object_exists(self.done_key)
+        if self.s3_client.object_listed(self.done_key):
+            return True
+        return confirm and self.s3_client.object_exists(self.done_key)
 
     def _extract_invocations(self) -> None:
         """
@@ -187,10 +227,10 @@ class FaaSrFunction:
         """
         logs_content = self._logger.logs_content
         with self._lock:
-            self._invocations = set(
-                re.sub(r"^" + self.workflow_name + "-", "", invocation)
+            self._invocations = {
+                invocation.removeprefix(self._workflow_prefix)
                 for invocation in self.invoked_regex.findall(logs_content)
-            )
+            }
 
     @property
     def logs(self) -> list[str]:
@@ -210,7 +250,7 @@ class FaaSrFunction:
     @property
     def function_complete(self) -> bool:
         """Get the function complete flag (thread-safe)."""
-        return self._check_for_completion()
+        return self._check_for_completion(confirm=True)
 
     @property
     def function_failed(self) -> bool:
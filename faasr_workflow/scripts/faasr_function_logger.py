@@ -2,6 +2,7 @@ import logging
 import threading
 import time
 from enum import Enum
+from functools import cached_property
 from typing import Callable
 
 from scripts.s3_client import FaaSrS3Client
@@ -50,6 +51,8 @@ class FaaSrFunctionLogger:
 
         # Log storage
         self._logs: list[str] = []
+        self._logs_etag: str | None = None
+        self._logs_offset = 0
 
         # State tracking
         self._logs_started = False
@@ -89,6 +92,19 @@ class FaaSrFunctionLogger:
         with self._lock:
             return self._logs.copy()
 
+    def logs_since(self, index: int) -> list[str]:
+        """
+        Get the logs after a given index (thread-safe).
+
+        Args:
+            index: The number of logs to skip.
+
+        Returns:
+            list[str]: The logs after the index.
+        """
+        with self._lock:
+            return self._logs[index:]
+
     @property
     def logs_content(self) -> str:
         """
@@ -100,7 +116,7 @@ class FaaSrFunctionLogger:
         with self._lock:
             return "\n".join(self._logs)
 
-    @property
+    @cached_property
     def logs_key(self) -> str:
         """
         Get the complete logs S3 key.
@@ -191,21 +207,47 @@ class FaaSrFunctionLogger:
 
     def _check_for_logs(self) -> bool:
         """
-        Check if the logs exist on S3.
+        Check if the logs exist on S3. This uses the key listing refreshed once per
+        tick by the workflow instead of a HeadObject per function.
 
         Returns:
             bool: True if logs exist on S3, False otherwise.
         """
-        return self.s3_client.object_exists(self.logs_key)
+        return self.s3_client.object_listed(self.logs_key)
 
     def _get_logs(self) -> list[str]:
         """
-        Get the logs from S3.
+        Get the new logs from S3.
+
+        Logs on S3 only ever grow, so this requests the bytes after those already
+        fetched, along with the ETag of the last fetch so unchanged logs are not
+        downloaded again.
 
         Returns:
-            list[str]: The logs.
+            list[str]: The logs added since the last fetch.
         """
-        return self.s3_client.get_object(self.logs_key).strip().split("\n")
+        response = self.s3_client.get_object_bytes_if_modified(
+            self.logs_key, self._logs_etag, start=self._logs_offset
+        )
+        if response is None:
+            return []
+
+        log_content, etag = response
+        if self.stop_requested or log_content.endswith(b"\n"):
+            self._logs_etag = etag
+        else:
+            # Hold back a partial last line until it is complete or the function is
+            # done, fetching it again next time
+            log_content = log_content[: log_content.rfind(b"\n") + 1]
+            self._logs_etag = None
+        self._logs_offset += len(log_content)
+
+        # Content ends in a newline unless the function is done, so the final piece of
+        # the split is the empty tail after it, or the trailing unterminated line
+        logs = log_content.split(b"\n")
+        if not logs[-1]:
+            logs.pop()
+        return [log.decode("utf-8").removesuffix("\r") for log in logs]
 
     def start(self) -> None:
         """Start the FaaSrFunctionLogger."""
@@ -236,17 +278,15 @@ class FaaSrFunctionLogger:
                     self._set_logs_started()
                     self._call_callbacks(LogEvent.LOG_CREATED)
             else:
-                log_content = self._get_logs()
-                num_existing_logs = len(self.logs)
-                new_logs = log_content[num_existing_logs:]
+                new_logs = self._get_logs()
 
                 if new_logs:
                     self._update_logs(new_logs)
                     self._call_callbacks(LogEvent.LOG_UPDATED)
 
+                    # Emit the batch as one record, keeping the prefix on every line
                     if self.stream_logs:
-                        for log in new_logs:
-                            self.logger.info(log)
+                        self.logger.info(f"\n[{self.logger_name}] ".join(new_logs))
 
                 # Check if logs are complete (no new logs after a cycle)
                 if self.stop_requested and not new_logs:
@@ -15,11 +15,12 @@ from FaaSr_py.helpers.s3_helper_functions import get_invocation_folder
 
 from scripts.faasr_function import FaaSrFunction
 from scripts.invoke_workflow import WorkflowMigrationAdapter
-from scripts.s3_client import FaaSrS3Client
+from scripts.s3_client import FaaSrS3Client, S3ClientError
 from scripts.utils import (
     completed,
     extract_function_name,
     failed,
+    get_s3_path,
     has_completed,
     has_final_state,
     invoked,
@@ -63,6 +64,7 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
     """
 
     logger_name = "FaaSrWorkflow"
+    max_check_interval = 30  # seconds between checks while nothing changes
 
     def __init__(
         self,
@@ -85,9 +87,10 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
         self.check_interval = check_interval
         self.last_change_time: float = time.time()
         self.seconds_since_last_change: float = 0.0
+        self._ticks_since_change = 0
 
         # Thread management
-        self._status_lock = threading.Lock()
+        self._status_condition = threading.Condition()
         self._monitoring_thread = None
         self._monitoring_complete = False
         self._shutdown_requested = False
@@ -101,9 +104,12 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
         self.workflow_name = self.workflow_data.get("WorkflowName")
         self.workflow_invoke = self.workflow_data.get("FunctionInvoke")
         self.function_names = self.workflow_data["ActionList"].keys()
+        self._invoker_ranks = self._build_invoker_ranks()
         self._stream_logs = stream_logs
+        self._invocation_folder: str | None = None
         self._functions: dict[str, FaaSrFunction] = {}
         self._prev_statuses: dict[str, FunctionStatus] = {}
+        self._completed_count = 0
 
         # Initialize S3 client for monitoring
         self.s3_client = FaaSrS3Client(
@@ -146,28 +152,60 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
         logger.setLevel(logging.INFO)
         return logger
 
-    def _build_reverse_adjacency_graph(self) -> dict[str, set[str]]:
+    def _build_reverse_adjacency_graph(self) -> dict[str, frozenset[str]]:
         """
         Initialize the reverse adjacency graph:
 
         ```py
         {
-            "invoker": [
-                "invoked_function",
-                "invoked_function",
+            "invoked_function": frozenset({
+                "invoker",
+                "invoker",
                 ...
-            ]
+            })
         }
         ```
 
+        Every function has an entry, so functions without invokers map to an empty
+        frozenset. The graph is read-only after initialization.
+
         Returns:
-            dict[str, set[str]]: The reverse adjacency graph.
+            dict[str, frozenset[str]]: The reverse adjacency graph.
         """
         reverse_adj_graph = defaultdict(set)
         for invoker, invoked_functions in self.adj_graph.items():
             for function in invoked_functions:
                 reverse_adj_graph[function].add(invoker)
-        return reverse_adj_graph
+        return {
+            function_name: frozenset(reverse_adj_graph[function_name])
+            for function_name in self.workflow_data["ActionList"]
+        }
+
+    def _build_invoker_ranks(self) -> dict[str, tuple[str, ...]]:
+        """
+        Initialize the ranked invokers of each function:
+
+        ```py
+        {
+            "invoked_function": ("invoker", "ranked_invoker(1)", ...),
+            ...
+        }
+        ```
+
+        Returns:
+            dict[str, tuple[str, ...]]: The ranked invokers of each function.
+        """
+        return {
+            function_name: tuple(
+                chain(
+                    *(
+                        self._iter_ranks(invoker)
+                        for invoker in self.reverse_adj_graph[function_name]
+                    )
+                )
+            )
+            for function_name in self.function_names
+        }
 
     def _build_functions(self, stream_logs: bool) -> list[FaaSrFunction]:
         """
@@ -194,7 +232,7 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
             function = FaaSrFunction(
                 function_name=rank,
                 workflow_name=self.workflow_name,
-                invocation_folder=get_invocation_folder(self.faasr_payload),
+                invocation_folder=self._invocation_folder,
                 s3_client=self.s3_client,
                 stream_logs=stream_logs,
             )
@@ -234,7 +272,7 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
         Returns:
             dict[str, FunctionStatus]: A copy of the function statuses.
         """
-        with self._status_lock:
+        with self._status_condition:
             return {
                 function.function_name: function.status
                 for function in self._functions.values()
@@ -248,7 +286,7 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
         Returns:
             bool: True if monitoring is complete, False otherwise.
         """
-        with self._status_lock:
+        with self._status_condition:
             return self._monitoring_complete
 
     @property
@@ -259,18 +297,22 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
         Returns:
             bool: True if a shutdown request has been made, False otherwise.
         """
-        with self._status_lock:
+        with self._status_condition:
             return self._shutdown_requested
 
     def _set_monitoring_complete(self) -> None:
         """Set the monitoring complete status to True (thread-safe)."""
-        with self._status_lock:
+        with self._status_condition:
             self._monitoring_complete = True
 
     def _set_shutdown_requested(self) -> None:
-        """Set the shutdown requested status to True (thread-safe)."""
-        with self._status_lock:
+        """
+        Set the shutdown requested status to True and wake the monitoring thread
+        (thread-safe).
+        """
+        with self._status_condition:
             self._shutdown_requested = True
+            self._status_condition.notify_all()
 
     #######################
     # Workflow monitoring #
@@ -280,7 +322,8 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
         Start workflow monitoring. This:
 
         - Resets the monitoring timer.
-        - Calls `_monitor_workflow_execution` in a loop until:
+        - Calls `_monitor_workflow_execution` in a loop, backing off between calls
+          while no status changes, until:
             - The monitoring timer times out.
             - A shutdown request is set.
             - `StopMonitoring` is raised.
@@ -299,7 +342,7 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
                 break
 
             self._increment_timer()
-            time.sleep(self.check_interval)
+            self._wait_for_next_check()
 
         self._finish_monitoring()
 
@@ -307,7 +350,9 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
         """
         Monitor the workflow execution. This:
 
+        - Refreshes the S3 key listing for the invocation folder.
         - Checks the completion status for each function.
+        - Checks each running function against the key listing.
         - Starts a function instance if the function has run and no instance exists.
         - Handles changes in each function status.
         - Cascades a failure to all pending functions when any function fails.
@@ -317,14 +362,31 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
         """
         workflow_failed = False
 
+        # List the invocation folder once for all function log and `.done` checks
+        try:
+            self.s3_client.refresh_listing(get_s3_path(f"{self._invocation_folder}/"))
+        except S3ClientError as e:
+            self.logger.warning(f"Error listing invocation folder: {e}")
+
+        # Read every status once so the whole tick works from one snapshot
+        statuses = self.get_function_statuses()
+
         # Check completion status for each function
-        for function in self._functions.values():
-            if pending(function.status):
-                self._handle_pending(function)
-            if self._prev_statuses[function.function_name] != function.status:
-                self._log_status_change(function)
-                self._prev_statuses[function.function_name] = function.status
-            if failed(function.status):
+        for function_name, function in self._functions.items():
+            status = statuses[function_name]
+            if pending(status) and self._ready_to_poll(function, statuses):
+                status = self._handle_pending(function)
+                statuses[function_name] = status
+            elif running(status):
+                status = function.check_status()
+                statuses[function_name] = status
+            if (prev_status := self._prev_statuses[function_name]) != status:
+                self._log_status_change(function_name, status)
+                if has_completed(status) != has_completed(prev_status):
+                    self._completed_count += 1 if has_completed(status) else -1
+                self._prev_statuses[function_name] = status
+                self._ticks_since_change = 0
+            if failed(status):
                 workflow_failed = True
                 break
 
@@ -340,7 +402,7 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
     ######################
     # Monitoring helpers #
     ######################
-    def _handle_pending(self, function: FaaSrFunction) -> None:
+    def _handle_pending(self, function: FaaSrFunction) -> FunctionStatus:
         """
         Handle a pending function.
 
@@ -349,34 +411,63 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
 
         Args:
             function_name: The name of the function to handle.
+
+        Returns:
+            FunctionStatus: The status of the function after handling.
         """
         invocation_status = self._check_invocation_status(function)
-        if invocation_status == InvocationStatus.INVOKED:
+        if invocation_status is InvocationStatus.INVOKED:
             self._reset_timer()
             function.set_status(FunctionStatus.INVOKED)
-        elif invocation_status == InvocationStatus.NOT_INVOKED:
+            return FunctionStatus.INVOKED
+        elif invocation_status is InvocationStatus.NOT_INVOKED:
             self._reset_timer()
             function.set_status(FunctionStatus.NOT_INVOKED)
+            return FunctionStatus.NOT_INVOKED
+        return FunctionStatus.PENDING
+
+    def _ready_to_poll(
+        self,
+        function: FaaSrFunction,
+        statuses: dict[str, FunctionStatus],
+    ) -> bool:
+        """
+        Check if a pending function's invocation status can have changed.
+
+        Invocations are only known once an invoker has reached a final state, so a
+        function is skipped while none of its invokers have finished.
+
+        Args:
+            function: The function to check.
+            statuses: The function statuses for the current tick.
+
+        Returns:
+            bool: True if the function has no invokers or any invoker has finished.
+        """
+        function_name = extract_function_name(function.function_name)
+        invoker_ranks = self._invoker_ranks[function_name]
+        return not invoker_ranks or any(
+            has_final_state(statuses[rank]) for rank in invoker_ranks
+        )
 
-    def _log_status_change(self, function: FaaSrFunction) -> None:
-        if failed(function.status):
-            self.logger.info(f"Function {function.function_name} failed")
-        elif not_invoked(function.status):
-            self.logger.info(f"Function {function.function_name} not invoked")
-        elif invoked(function.status):
-            self.logger.info(f"Function {function.function_name} invoked")
-        elif running(function.status):
-            self.logger.info(f"Function {function.function_name} running")
-        elif completed(function.status):
-            self.logger.info(f"Function {function.function_name} completed")
+    def _log_status_change(self, function_name: str, status: FunctionStatus) -> None:
+        if failed(status):
+            self.logger.info(f"Function {function_name} failed")
+        elif not_invoked(status):
+            self.logger.info(f"Function {function_name} not invoked")
+        elif invoked(status):
+            self.logger.info(f"Function {function_name} invoked")
+        elif running(status):
+            self.logger.info(f"Function {function_name} running")
+        elif completed(status):
+            self.logger.info(f"Function {function_name} completed")
 
     def _all_functions_completed(self) -> bool:
         """
-        Check if all functions have completed.
+        Check if all functions have completed. This uses the count of completed
+        functions kept up to date as status changes are handled.
         """
-        return all(
-            has_completed(function.status) for function in self._functions.values()
-        )
+        return self._completed_count == len(self._functions)
 
     def _finish_monitoring(self) -> None:
         """
@@ -431,6 +522,30 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
         """Increment the monitoring timer."""
         self.seconds_since_last_change = time.time() - self.last_change_time
 
+    def _next_check_interval(self) -> float:
+        """
+        Get the time to wait before the next check. This doubles the check interval
+        for each tick without a status change, up to 32 times the check interval or
+        `max_check_interval`, whichever is lower.
+
+        Returns:
+            float: The number of seconds to wait.
+        """
+        backoff = 2 ** min(self._ticks_since_change, 5)
+        self._ticks_since_change += 1
+        return min(
+            self.check_interval * backoff,
+            max(self.check_interval, self.max_check_interval),
+        )
+
+    def _wait_for_next_check(self) -> None:
+        """Wait until the next check, returning early if a shutdown is requested."""
+        timeout = self._next_check_interval()
+        with self._status_condition:
+            self._status_condition.wait_for(
+                lambda: self._shutdown_requested, timeout=timeout
+            )
+
     def _did_timeout(self) -> bool:
         """
         Check if the monitoring timer has timed out.
@@ -512,9 +627,15 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
     def trigger_workflow(self) -> None:
         super().trigger_workflow()
 
+        # The payload is fixed once triggered, so resolve the invocation folder once
+        self._invocation_folder = get_invocation_folder(self.faasr_payload)
+
         # Build functions after trigger_workflow initializes FaaSrPayload
         self._functions = self._build_functions(self._stream_logs)
         self._prev_statuses = self.get_function_statuses()
+        self._completed_count = sum(
+            has_completed(status) for status in self._prev_statuses.values()
+        )
 
         self.logger.info(
             f"Workflow {self.workflow_name} triggered with InvocationID: {self.faasr_payload['InvocationID']}"
@@ -561,14 +682,7 @@ class FaaSrWorkflow(WorkflowMigrationAdapter):
         Returns:
             InvocationStatus: The invocation status of the function.
         """
-        for rank in chain(
-            *(
-                self._iter_ranks(invoker)
-                for invoker in self.reverse_adj_graph[
-                    extract_function_name(function.function_name)
-                ]
-            )
-        ):
+        for rank in self._invoker_ranks[extract_function_name(function.function_name)]:
             if status := self._get_invocation_status(self._functions[rank], function):
                 return status
         return InvocationStatus.NOT_INVOKED
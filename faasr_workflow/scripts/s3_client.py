@@ -1,8 +1,18 @@
 from typing import Any
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# Enough pooled keep-alive connections for every function logger polling at once
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=10,
+)
+
 
 class S3ClientInitializationError(Exception):
     """Exception raised for S3 client initialization errors"""
@@ -45,6 +55,7 @@ class FaaSrS3Client:
                     aws_secret_access_key=secret_key,
                     region_name=datastore_config["Region"],
                     endpoint_url=datastore_config["Endpoint"],
+                    config=S3_CLIENT_CONFIG,
                 )
             else:
                 self._client = boto3.client(
@@ -52,9 +63,11 @@ class FaaSrS3Client:
                     aws_access_key_id=access_key,
                     aws_secret_access_key=secret_key,
                     region_name=datastore_config["Region"],
+                    config=S3_CLIENT_CONFIG,
                 )
 
             self._bucket_name = datastore_config["Bucket"]
+            self._listed_keys: frozenset[str] = frozenset()
 
         except ClientError as e:
             raise S3ClientInitializationError(f"boto3 client error: {e}") from e
@@ -73,6 +86,26 @@ class FaaSrS3Client:
                 raise S3ClientError(f"Error checking object existence: {e}") from e
         return True
 
+    def list_keys(self, prefix: str) -> set[str]:
+        try:
+            paginator = self._client.get_paginator("list_objects_v2")
+            return {
+                obj["Key"]
+                for page in paginator.paginate(Bucket=self._bucket_name, Prefix=prefix)
+                for obj in page.get("Contents", [])
+            }
+        except ClientError as e:
+            raise S3ClientError(f"boto3 client error listing objects: {e}") from e
+        except Exception as e:
+            raise S3ClientError(f"Unhandled error listing objects: {e}") from e
+
+    def refresh_listing(self, prefix: str) -> None:
+        # Swap in a new snapshot so readers on other threads never see a partial set
+        self._listed_keys = frozenset(self.list_keys(prefix))
+
+    def object_listed(self, key: str) -> bool:
+        return key in self._listed_keys
+
     def get_object(self, key: str, encoding: str = "utf-8") -> str:
         try:
             return (
@@ -86,3 +119,33 @@ class FaaSrS3Client:
             raise S3ClientError(f"boto3 client error getting object: {e}") from e
         except Exception as e:
             raise S3ClientError(f"Unhandled error getting object: {e}") from e
+
+    def get_object_bytes_if_modified(
+        self,
+        key: str,
+        etag: str | None,
+        start: int = 0,
+    ) -> tuple[bytes, str] | None:
+        # Returns the bytes from `start` onwards, or None when the object still
+        # matches `etag` or has no bytes past `start`
+        kwargs = {}
+        if etag:
+            kwargs["IfNoneMatch"] = etag
+        if start:
+            kwargs["Range"] = f"bytes={start}-"
+
+        try:
+            response = self._client.get_object(
+                Bucket=self._bucket_name, Key=key, **kwargs
+            )
+            return response["Body"].read(), response["ETag"]
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("304", "NotModified"):
+                return None
+            if e.response["Error"]["Code"] in ("416", "InvalidRange"):
+                return None
+            if e.response["Error"]["Code"] == "404":
+                raise S3ClientError(f"Object does not exist: {e}") from e
+            raise S3ClientError(f"boto3 client error getting object: {e}") from e
+        except Exception as e:
+            raise S3ClientError(f"Unhandled error getting object: {e}") from e
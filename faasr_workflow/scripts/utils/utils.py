@@ -1,5 +1,19 @@
 from scripts.utils.enums import FunctionStatus
 
+_NOT_RUN_STATUSES = frozenset(
+    {FunctionStatus.PENDING, FunctionStatus.INVOKED, FunctionStatus.NOT_INVOKED}
+)
+_COMPLETED_STATUSES = frozenset({FunctionStatus.COMPLETED, FunctionStatus.NOT_INVOKED})
+_FINAL_STATUSES = frozenset(
+    {
+        FunctionStatus.COMPLETED,
+        FunctionStatus.NOT_INVOKED,
+        FunctionStatus.FAILED,
+        FunctionStatus.TIMEOUT,
+        FunctionStatus.SKIPPED,
+    }
+)
+
 
 def extract_function_name(function_name: str) -> str:
     return function_name.split("(")[0]
@@ -10,50 +24,44 @@ def get_s3_path(key: str) -> str:
 
 
 def pending(status: FunctionStatus) -> bool:
-    return status == FunctionStatus.PENDING
+    return status is FunctionStatus.PENDING
 
 
 def invoked(status: FunctionStatus) -> bool:
-    return status == FunctionStatus.INVOKED
+    return status is FunctionStatus.INVOKED
 
 
 def not_invoked(status: FunctionStatus) -> bool:
-    return status == FunctionStatus.NOT_INVOKED
+    return status is FunctionStatus.NOT_INVOKED
 
 
 def running(status: FunctionStatus) -> bool:
-    return status == FunctionStatus.RUNNING
+    return status is FunctionStatus.RUNNING
 
 
 def completed(status: FunctionStatus) -> bool:
-    return status == FunctionStatus.COMPLETED
+    return status is FunctionStatus.COMPLETED
 
 
 def failed(status: FunctionStatus) -> bool:
-    return status == FunctionStatus.FAILED
+    return status is FunctionStatus.FAILED
 
 
 def skipped(status: FunctionStatus) -> bool:
-    return status == FunctionStatus.SKIPPED
+    return status is FunctionStatus.SKIPPED
 
 
 def timed_out(status: FunctionStatus) -> bool:
-    return status == FunctionStatus.TIMEOUT
+    return status is FunctionStatus.TIMEOUT
 
 
 def has_run(status: FunctionStatus) -> bool:
-    return not (pending(status) or invoked(status) or not_invoked(status))
+    return status not in _NOT_RUN_STATUSES
 
 
 def has_completed(status: FunctionStatus) -> bool:
-    return completed(status) or not_invoked(status)
+    return status in _COMPLETED_STATUSES
 
 
 def has_final_state(status: FunctionStatus) -> bool:
-    return (
-        completed(status)
-        or not_invoked(status)
-        or failed(status)
-        or timed_out(status)
-        or skipped(status)
-    )
+    return status in _FINAL_STATUSES
@@ -19,12 +19,12 @@ from contextlib import suppress
 from datetime import UTC, datetime
 
 import boto3
-from botocore.exceptions import ClientError
 from FaaSr_py.helpers.graph_functions import build_adjacency_graph
 from FaaSr_py.helpers.s3_helper_functions import get_invocation_folder
 
 from scripts.function_logger import FunctionLogger
 from scripts.invoke_workflow import WorkflowMigrationAdapter
+from scripts.s3_client import S3_CLIENT_CONFIG
 from scripts.utils import (
     extract_function_name,
     get_s3_path,
@@ -108,6 +108,8 @@ class WorkflowRunner(WorkflowMigrationAdapter):
         self.workflow_invoke = self.workflow_data.get("FunctionInvoke")
         self.function_names = self.workflow_data["ActionList"].keys()
         self._function_statuses = self._build_function_statuses()
+        self._existing_keys: set[str] = set()
+        self._invocation_folder: str | None = None
 
         # Setup signal handlers for graceful shutdown
         self._setup_signal_handlers()
@@ -169,6 +171,7 @@ class WorkflowRunner(WorkflowMigrationAdapter):
                     aws_secret_access_key=os.getenv("MY_S3_BUCKET_SECRETKEY"),
                     region_name=datastore_config["Region"],
                     endpoint_url=datastore_config["Endpoint"],
+                    config=S3_CLIENT_CONFIG,
                 )
             else:
                 s3_client = boto3.client(
@@ -176,6 +179,7 @@ class WorkflowRunner(WorkflowMigrationAdapter):
                     aws_access_key_id=os.getenv("MY_S3_BUCKET_ACCESSKEY"),
                     aws_secret_access_key=os.getenv("MY_S3_BUCKET_SECRETKEY"),
                     region_name=datastore_config["Region"],
+                    config=S3_CLIENT_CONFIG,
                 )
 
             bucket_name = datastore_config["Bucket"]
@@ -187,28 +191,34 @@ class WorkflowRunner(WorkflowMigrationAdapter):
             self.logger.error(f"Failed to initialize S3 client: {e}")
             raise InitializationError(f"Failed to initialize S3 client: {e}")
 
-    def _build_reverse_adjacency_graph(self) -> dict[str, set[str]]:
+    def _build_reverse_adjacency_graph(self) -> dict[str, frozenset[str]]:
         """
         Initialize the reverse adjacency graph:
 
         ```py
         {
-            "invoker": [
-                "invoked_function",
-                "invoked_function",
+            "invoked_function": frozenset({
+                "invoker",
+                "invoker",
                 ...
-            ]
+            })
         }
         ```
 
+        Every function has an entry, so functions without invokers map to an empty
+        frozenset. The graph is read-only after initialization.
+
         Returns:
-            dict[str, set[str]]: The reverse adjacency graph.
+            dict[str, frozenset[str]]: The reverse adjacency graph.
         """
         reverse_adj_graph = defaultdict(set)
         for invoker, invoked_functions in self.adj_graph.items():
             for function in invoked_functions:
                 reverse_adj_graph[function].add(invoker)
-        return reverse_adj_graph
+        return {
+            function_name: frozenset(reverse_adj_graph[function_name])
+            for function_name in self.workflow_data["ActionList"]
+        }
 
     def _build_function_statuses(self) -> dict[str, FunctionStatus]:
         """
@@ -356,6 +366,7 @@ class WorkflowRunner(WorkflowMigrationAdapter):
         """
         Monitor the workflow execution. This:
 
+        - Refreshes the S3 key listing for the invocation folder.
         - Checks the completion status for each function.
         - Starts a function logger if the function has run and no logger exists.
         - Handles changes in each function status.
@@ -366,6 +377,8 @@ class WorkflowRunner(WorkflowMigrationAdapter):
         """
         failed = False
 
+        self._refresh_s3_keys()
+
         # Check completion status for each function
         for function_name, status in self.get_function_statuses().items():
             if has_run(status) and function_name not in self.function_logs:
@@ -446,7 +459,7 @@ class WorkflowRunner(WorkflowMigrationAdapter):
         function_logger = FunctionLogger(
             function_name=function_name,
             workflow_name=self.workflow_name,
-            invocation_folder=get_invocation_folder(self.faasr_payload),
+            invocation_folder=self._invocation_folder,
             bucket_name=self.bucket_name,
             s3_client=self.s3_client,
             stream_logs=self.stream_logs,
@@ -530,8 +543,8 @@ class WorkflowRunner(WorkflowMigrationAdapter):
 
     def _check_function_running(self, function_name: str) -> bool:
         """
-        Check if a function is running. This returns True if a log file exists for the
-        function on S3.
+        Check if a function is running. This returns True if a log file for the
+        function appeared in the last S3 key listing.
 
         Args:
             function_name: The name of the function to check.
@@ -540,9 +553,8 @@ class WorkflowRunner(WorkflowMigrationAdapter):
             bool: True if the function is running, False otherwise.
         """
         try:
-            invocation_folder = get_invocation_folder(self.faasr_payload)
-            key = get_s3_path(f"{invocation_folder}/{function_name}.txt")
-            return self._check_object_exists(key)
+            key = get_s3_path(f"{self._invocation_folder}/{function_name}.txt")
+            return key in self._existing_keys
 
         except Exception as e:
             traceback.print_exc()
@@ -660,6 +672,9 @@ class WorkflowRunner(WorkflowMigrationAdapter):
     def trigger_workflow(self) -> None:
         super().trigger_workflow()
 
+        # The payload is fixed once triggered, so resolve the invocation folder once
+        self._invocation_folder = get_invocation_folder(self.faasr_payload)
+
         self.logger.info(
             f"Workflow {self.workflow_name} triggered with InvocationID: {self.faasr_payload['InvocationID']}"
         )
@@ -687,27 +702,24 @@ class WorkflowRunner(WorkflowMigrationAdapter):
         for rank in range(1, self.ranks[function_name] + 1):
             yield f"{function_name}({rank})"
 
-    def _check_object_exists(self, key: str) -> bool:
+    def _refresh_s3_keys(self) -> None:
         """
-        Check if an object exists in S3.
-
-        Args:
-            key: The key of the object to check.
-
-        Returns:
-            bool: True if the object exists, False otherwise.
-
-        Raises:
-            ClientError: If an unexpected error occurs.
+        List the invocation folder with a single paginated ListObjectsV2 and store
+        the existing keys. Errors are logged and the previous listing is kept.
         """
         try:
-            self.s3_client.head_object(Bucket=self.bucket_name, Key=str(key))
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "404":
-                return False
-            else:
-                raise e
-        return True
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            self._existing_keys = {
+                obj["Key"]
+                for page in paginator.paginate(
+                    Bucket=self.bucket_name,
+                    Prefix=get_s3_path(f"{self._invocation_folder}/"),
+                )
+                for obj in page.get("Contents", [])
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error listing invocation folder: {e}")
 
     def _check_invocation_status(self, function_name: str) -> InvocationStatus:
         """
@@ -1,4 +1,30 @@
-import csv
+from importlib.util import find_spec
+
+import numpy as np
+import pandas as pd
+
+CHUNK_SIZE = 1 << 16  # rows read from each input at a time
+
+# Use pyarrow's columnar CSV writer when it is installed
+USE_PYARROW = find_spec("pyarrow") is not None
+
+
+def write_rows(df, fout):
+    """
+    Appends the rows of a DataFrame to an open binary CSV file, without a header.
+    Uses pyarrow's CSV writer when it is installed.
+    """
+    if USE_PYARROW:
+        from pyarrow import Table, csv
+
+        csv.write_csv(
+            Table.from_pandas(df, preserve_index=False),
+            fout,
+            write_options=csv.WriteOptions(include_header=False, quoting_style="none"),
+        )
+    else:
+        df.to_csv(fout, header=False, index=False)
+
 
 def compute_sum(folder, input1, input2, output):
     """
@@ -9,26 +35,33 @@ def compute_sum(folder, input1, input2, output):
     """
     faasr_get_file(local_file="input1.csv", remote_folder=folder, remote_file=input1)
     faasr_get_file(local_file="input2.csv", remote_folder=folder, remote_file=input2)
-  
-    with open("input1.csv", newline="") as f1, open("input2.csv", newline="") as f2:
-        reader1 = csv.reader(f1)
-        reader2 = csv.reader(f2)
-
-        # Read headers
-        header1 = next(reader1)
-        header2 = next(reader2)
 
-        if header1 != header2:
+    # Compare the raw header lines before parsing any data
+    with open("input1.csv", "rb") as f1, open("input2.csv", "rb") as f2:
+        header = f1.readline().rstrip(b"\r\n")
+        if header != f2.readline().rstrip(b"\r\n"):
             raise ValueError("Input files have different headers!")
 
-        # Prepare output
-        with open("output.csv", "w", newline="") as fout:
-            writer = csv.writer(fout)
-            writer.writerow(header1)  # write header
+    with (
+        pd.read_csv(
+            "input1.csv", dtype=np.int64, engine="c", chunksize=CHUNK_SIZE
+        ) as reader1,
+        pd.read_csv(
+            "input2.csv", dtype=np.int64, engine="c", chunksize=CHUNK_SIZE
+        ) as reader2,
+        open("output.csv", "wb", buffering=1 << 20) as fout,
+    ):
+        # Write the validated header verbatim rather than pandas' column names
+        fout.write(header + b"\n")
 
-            # Process row by row
-            for row1, row2 in zip(reader1, reader2):
-                summed_row = [int(a) + int(b) for a, b in zip(row1, row2)]
-                writer.writerow(summed_row)
+        # Stream both files chunk by chunk so memory stays bounded
+        for chunk1, chunk2 in zip(reader1, reader2):
+            # Sum the rows both chunks have in a single vectorized add
+            num_rows = min(len(chunk1), len(chunk2))
+            summed = pd.DataFrame(
+                chunk1.to_numpy()[:num_rows] + chunk2.to_numpy()[:num_rows],
+                columns=chunk1.columns,
+            )
+            write_rows(summed, fout)
 
-    faasr_put_file(local_file="output.csv", remote_folder=folder, remote_file=output)
\ No newline at end of file
+    faasr_put_file(local_file="output.csv", remote_folder=folder, remote_file=output)